@@ -37,16 +37,21 @@ def _now_iso() -> str:
 # CPG loading & normalization
 # ---------------------------------------------------------------------------
 
-def load_cpg(path: str) -> dict:
+def load_cpg(path: str) -> tuple[dict, str]:
     """Load a treeloom CPG JSON file and flatten location fields on nodes.
 
     Raw CPG nodes nest file/line/column under ``location`` and
     ``end_location``.  This function hoists them to top-level keys
     (``file``, ``line``, ``column``, ``end_line``) so the rest of the
     code can access them uniformly.
+
+    Returns ``(cpg, sha256)``.  The digest is taken from the same bytes
+    that were parsed, so large CPGs are read from disk only once.
     """
-    with open(path) as f:
-        cpg = json.load(f)
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    cpg = json.loads(raw)
     for key in ("nodes", "edges"):
         if key not in cpg:
             raise SystemExit(f"CPG file missing required key '{key}'")
@@ -59,23 +64,33 @@ def load_cpg(path: str) -> dict:
         end_loc = node.get("end_location") or {}
         node["end_line"] = end_loc.get("line")
 
-    return cpg
+    return cpg, digest
 
 
 # ---------------------------------------------------------------------------
 # cpg_ref
 # ---------------------------------------------------------------------------
 
-def build_cpg_ref(cpg: dict, cpg_path: str, rel_path: str | None) -> dict:
-    """Build the cpg_ref section of the spec."""
+def build_cpg_ref(cpg: dict, cpg_path: str, rel_path: str | None,
+                  sha256: str | None = None) -> dict:
+    """Build the cpg_ref section of the spec.
+
+    Pass *sha256* when the digest is already known (see load_cpg) to avoid
+    re-reading the CPG file.
+    """
     nodes = cpg["nodes"]
     edges = cpg["edges"]
-    unique_files = {n["file"] for n in nodes if n.get("file")}
-    fn_count = sum(1 for n in nodes if n["kind"] == "function")
+    unique_files: set[str] = set()
+    fn_count = 0
+    for n in nodes:
+        if n.get("file"):
+            unique_files.add(n["file"])
+        if n["kind"] == "function":
+            fn_count += 1
 
     return {
         "path": rel_path or os.path.basename(cpg_path),
-        "sha256": compute_sha256(cpg_path),
+        "sha256": sha256 or compute_sha256(cpg_path),
         "built_at": _now_iso(),
         "treeloom_version": cpg.get("treeloom_version", "unknown"),
         "stats": {
@@ -247,12 +262,14 @@ def build_elements(cpg: dict, language: str,
     kind_order = {"module": 0, "class": 1, "function": 2}
     relevant_nodes.sort(key=lambda n: kind_order.get(n["kind"], 3))
 
-    # First pass: compute element IDs.
+    # First pass: resolve parents and compute element IDs.
     element_id_of: dict[str, str] = {}
+    parent_of: dict[str, dict | None] = {}
     seen_ids: set[str] = set()
 
     for node in relevant_nodes:
         parent_elem = resolve_parent_element(node, node_map)
+        parent_of[node["id"]] = parent_elem
         parent_eid = element_id_of.get(parent_elem["id"]) if parent_elem else None
         eid = node_to_element_id(
             node, parent_elem, parent_eid, language, source_root_prefix
@@ -266,7 +283,7 @@ def build_elements(cpg: dict, language: str,
     elements: dict[str, dict] = {}
     for node in relevant_nodes:
         eid = element_id_of[node["id"]]
-        parent_elem = resolve_parent_element(node, node_map)
+        parent_elem = parent_of[node["id"]]
 
         elem: dict = {
             "hierarchy_level": node["kind"],
@@ -567,7 +584,7 @@ def assemble_spec(
     cpg_rel_path: str | None = None,
 ) -> dict:
     """Orchestrate spec assembly from all inputs."""
-    cpg = load_cpg(cpg_path)
+    cpg, cpg_sha256 = load_cpg(cpg_path)
     source_root_prefix = infer_source_root_prefix(cpg, source_root)
 
     tools: dict[str, str] = {}
@@ -575,7 +592,7 @@ def assemble_spec(
     if tv:
         tools["treeloom"] = tv
 
-    cpg_ref = build_cpg_ref(cpg, cpg_path, cpg_rel_path)
+    cpg_ref = build_cpg_ref(cpg, cpg_path, cpg_rel_path, cpg_sha256)
     elements = build_elements(cpg, language, source_root, source_root_prefix)
 
     security_findings: list[dict] | None = None
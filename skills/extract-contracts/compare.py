@@ -29,6 +29,9 @@ ARRAY_FIELDS = (
 )
 TRUST_KEYS = ("input_trust", "output_trust", "sanitization")
 
+# Compiled once; keywords() runs once per contract item.
+WORD_RE = re.compile(r"[a-z]+")
+
 
 # --CLI
 # --
@@ -70,7 +73,7 @@ def load_spec(path: str) -> dict:
 
 def keywords(text: str) -> set[str]:
     """Return significant lowercase words from a string."""
-    words = re.findall(r"[a-z]+", text.lower())
+    words = WORD_RE.findall(text.lower())
     return {w for w in words if w not in STOPWORDS and len(w) > 2}
 
 
@@ -92,15 +95,23 @@ def item_to_text(item) -> str:
     return str(item)
 
 
-def covers(ref_item, ext_items: list) -> bool:
-    """Return True if any extracted item shares significant keywords with ref_item."""
+def item_keywords(items: list) -> list[set[str]]:
+    """Return the keyword set of each item, for reuse across covers() calls."""
+    return [keywords(item_to_text(item)) for item in items]
+
+
+def covers(ref_item, ext_keywords: list[set[str]]) -> bool:
+    """Return True if any extracted item shares significant keywords with ref_item.
+
+    *ext_keywords* is item_keywords() of the extracted items, computed once
+    per field rather than once per reference item.
+    """
     ref_text = item_to_text(ref_item)
     ref_kw = keywords(ref_text)
     if not ref_kw:
         return False
     threshold = max(1, len(ref_kw) // 3)
-    for ext in ext_items:
-        ext_kw = keywords(item_to_text(ext))
+    for ext_kw in ext_keywords:
         if len(ref_kw & ext_kw) >= threshold:
             return True
     return False
@@ -128,24 +139,24 @@ def compare_trust_boundary(ref_tb: dict, ext_tb: dict) -> dict:
     return result
 
 
-def compare_error_conditions(ref_list: list, ext_list: list) -> tuple[int, int]:
-    """Return (matched_count, reference_count)."""
-    matched = sum(1 for r in ref_list if covers(r, ext_list))
-    return matched, len(ref_list)
-
-
 def compare_element(ext_contract: dict, ref_contract: dict) -> dict:
     """Produce a structured comparison for one element."""
-    all_fields = set(ref_contract) | set(ext_contract)
-    matched_fields = sorted(all_fields & set(ext_contract) & set(ref_contract))
-    missing_fields = sorted(set(ref_contract) - set(ext_contract))
-    extra_fields = sorted(set(ext_contract) - set(ref_contract))
-
+    ref_fields = set(ref_contract)
+    ext_fields = set(ext_contract)
+    matched_fields = sorted(ref_fields & ext_fields)
+    missing_fields = sorted(ref_fields - ext_fields)
+    extra_fields = sorted(ext_fields - ref_fields)
+
+    details: dict = {}
+    # (matched, total) per scored field, so compute_summary() need not
+    # re-parse the human-readable strings in details.
+    counts: dict[str, list[int]] = {}
     result: dict = {
         "matched_fields": matched_fields,
         "missing_fields": missing_fields,
         "extra_fields": extra_fields,
-        "details": {},
+        "details": details,
+        "counts": counts,
     }
 
     # Purpose
@@ -154,7 +165,8 @@ def compare_element(ext_contract: dict, ref_contract: dict) -> dict:
             str(ext_contract["purpose"]), str(ref_contract["purpose"])
         )
         pct = (overlap / total * 100) if total else 0
-        result["details"]["purpose"] = {
+        counts["purpose"] = [overlap, total]
+        details["purpose"] = {
             "reference": str(ref_contract["purpose"])[:200],
             "extracted": str(ext_contract["purpose"])[:200],
             "keyword_overlap": f"{overlap}/{total} ({pct:.0f}%)",
@@ -164,38 +176,43 @@ def compare_element(ext_contract: dict, ref_contract: dict) -> dict:
     for field in ARRAY_FIELDS:
         if field not in ref_contract:
             continue
-        ref_items = ref_contract[field] if isinstance(ref_contract[field], list) else [ref_contract[field]]
+        ref_val = ref_contract[field]
+        ref_items = ref_val if isinstance(ref_val, list) else [ref_val]
         if field not in ext_contract:
-            result["details"][field] = f"0/{len(ref_items)} covered (field missing)"
+            counts[field] = [0, len(ref_items)]
+            details[field] = f"0/{len(ref_items)} covered (field missing)"
             continue
-        ext_items = ext_contract[field] if isinstance(ext_contract[field], list) else [ext_contract[field]]
+        ext_val = ext_contract[field]
+        ext_items = ext_val if isinstance(ext_val, list) else [ext_val]
+        ext_kw = item_keywords(ext_items)
 
-        if field == "error_conditions":
-            matched, total = compare_error_conditions(ref_items, ext_items)
-        else:
-            matched = sum(1 for r in ref_items if covers(r, ext_items))
-            total = len(ref_items)
+        # One covers() call per reference item, reused for the uncovered list.
+        hits = [covers(r, ext_kw) for r in ref_items]
+        matched, total = sum(hits), len(ref_items)
+        counts[field] = [matched, total]
 
         if matched == total:
-            result["details"][field] = f"{matched}/{total} covered"
+            details[field] = f"{matched}/{total} covered"
         else:
             uncovered = [
                 item_to_text(r)[:120]
-                for r in ref_items
-                if not covers(r, ext_items)
+                for r, hit in zip(ref_items, hits)
+                if not hit
             ]
-            result["details"][field] = {
+            details[field] = {
                 "coverage": f"{matched}/{total} covered",
                 "missing": uncovered,
             }
 
     # Trust boundary
     if "trust_boundary" in ref_contract:
-        ref_tb = ref_contract["trust_boundary"] if isinstance(ref_contract["trust_boundary"], dict) else {}
+        ref_tb = ref_contract["trust_boundary"]
+        if not isinstance(ref_tb, dict):
+            ref_tb = {}
         ext_tb = ext_contract.get("trust_boundary") or {}
         if not isinstance(ext_tb, dict):
             ext_tb = {}
-        result["details"]["trust_boundary"] = compare_trust_boundary(ref_tb, ext_tb)
+        details["trust_boundary"] = compare_trust_boundary(ref_tb, ext_tb)
 
     # Severity consistency for error_conditions
     if "error_conditions" in ref_contract and "error_conditions" in ext_contract:
@@ -204,7 +221,7 @@ def compare_element(ext_contract: dict, ref_contract: dict) -> dict:
         if isinstance(ref_ec, list) and isinstance(ext_ec, list):
             ref_sevs = {e.get("severity") for e in ref_ec if isinstance(e, dict)}
             ext_sevs = {e.get("severity") for e in ext_ec if isinstance(e, dict)}
-            result["details"]["error_severity_levels"] = {
+            details["error_severity_levels"] = {
                 "reference": sorted(s for s in ref_sevs if s),
                 "extracted": sorted(s for s in ext_sevs if s),
                 "match": ref_sevs == ext_sevs,
@@ -297,19 +314,17 @@ def compute_summary(comparisons: list[dict]) -> dict:
             field_coverages.append(len(cmp["matched_fields"]) / all_ref_fields * 100)
 
         details = cmp["details"]
+        counts = cmp["counts"]
 
-        if "purpose" in details:
-            raw = details["purpose"]["keyword_overlap"]
-            nums = re.findall(r"\d+", raw)
-            if len(nums) >= 2 and int(nums[1]) > 0:
-                purpose_overlaps.append(int(nums[0]) / int(nums[1]) * 100)
+        if "purpose" in counts:
+            overlap, total = counts["purpose"]
+            if total > 0:
+                purpose_overlaps.append(overlap / total * 100)
 
-        if "error_conditions" in details:
+        if "error_conditions" in counts:
             elements_with_errors += 1
-            ec = details["error_conditions"]
-            coverage_str = ec if isinstance(ec, str) else ec.get("coverage", "")
-            nums = re.findall(r"\d+", coverage_str)
-            if len(nums) >= 2 and nums[0] == nums[1]:
+            matched, total = counts["error_conditions"]
+            if matched == total:
                 full_error_coverage += 1
 
         if "trust_boundary" in details:
@@ -317,9 +332,8 @@ def compute_summary(comparisons: list[dict]) -> dict:
             tb = details["trust_boundary"]
             if isinstance(tb, dict):
                 statuses = list(tb.values())
-                if statuses and all(s in ("MATCH", "PARTIAL") for s in statuses):
-                    if all(s == "MATCH" for s in statuses):
-                        trust_match += 1
+                if statuses and all(s == "MATCH" for s in statuses):
+                    trust_match += 1
 
     return {
         "elements_compared": n,
@@ -8,8 +8,13 @@ the enriched spec back in-place.
 
 import argparse
 import json
+import os
 import subprocess
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import partial
 
 import requests
 
@@ -83,8 +88,9 @@ def parse_args() -> argparse.Namespace:
                         help="Show extraction plan without calling LLM.")
     parser.add_argument("--max-group-size", type=int, default=6,
                         help="Max methods per class group before splitting (default: 6).")
-    parser.add_argument("--concurrency", type=int, default=4,
-                        help="Max parallel LLM calls (default: 4; currently sequential).")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Max parallel LLM calls (default: 1, sequential). "
+                             "Higher values may raise the endpoint's drop rate.")
     parser.add_argument("--skip-existing", action="store_true",
                         help="Skip elements that already have a non-empty contract.")
     return parser.parse_args()
@@ -99,9 +105,22 @@ def load_spec(path: str) -> dict:
 
 
 def save_spec(path: str, spec: dict) -> None:
-    with open(path, "w") as f:
-        json.dump(spec, f, indent=2)
-        f.write("\n")
+    """Write the spec via a sibling temp file and an atomic rename.
+
+    The spec is rewritten after every extracted group, so an interrupted
+    write (Ctrl-C, crash) must not leave a truncated spec.json behind and
+    lose the contracts extracted so far.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(spec, f, indent=2)
+            f.write("\n")
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
 
 
 # --Scope filtering
@@ -201,20 +220,29 @@ def group_elements(elements: dict, max_group_size: int = 6,
         groups.append({"type": "single", "element_id": eid})
 
     if skip_existing:
-        filtered = []
-        for g in groups:
-            if g["type"] == "single":
-                if _has_contract(elements[g["element_id"]]):
-                    continue
-            elif g["type"] == "class":
-                if all(_has_contract(elements[eid]) for eid in g["all_ids"]):
-                    continue
-            filtered.append(g)
-        groups = filtered
+        groups = drop_existing(groups, elements)
 
     return groups
 
 
+def drop_existing(groups: list[dict], elements: dict) -> list[dict]:
+    """Drop groups whose elements already have contracts.
+
+    Singles are dropped when their element has a contract; class groups only
+    when ALL members do.
+    """
+    filtered = []
+    for g in groups:
+        if g["type"] == "single":
+            if _has_contract(elements[g["element_id"]]):
+                continue
+        elif g["type"] == "class":
+            if all(_has_contract(elements[eid]) for eid in g["all_ids"]):
+                continue
+        filtered.append(g)
+    return filtered
+
+
 # --Greploom
 # --
 
@@ -292,6 +320,15 @@ def format_findings_section(findings: list[dict]) -> str:
     return "\n".join(lines)
 
 
+def _findings_context(spec: dict, file_path: str, cve_section: str) -> str:
+    """Combine file-level security findings and ecosystem CVEs for a prompt."""
+    findings_section = format_findings_section(get_security_findings(spec, file_path))
+    if cve_section:
+        return (findings_section + "\n\n" + cve_section
+                if findings_section else cve_section)
+    return findings_section
+
+
 # --Prompt builders
 # --
 
@@ -383,10 +420,28 @@ def build_prompt_class(class_id: str, member_ids: list[str],
 # --LLM call
 # --
 
-def resolve_model_name(endpoint: str) -> str:
+_thread_state = threading.local()
+
+
+def thread_session() -> requests.Session:
+    """Return the calling thread's own HTTP session, creating it on first use.
+
+    Reusing a session keeps connections to the endpoint alive across calls
+    instead of opening a new TCP/TLS connection per element. requests does
+    not guarantee that a Session is thread-safe, so threads never share one.
+    """
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _thread_state.session = requests.Session()
+    return session
+
+
+def resolve_model_name(endpoint: str,
+                       session: requests.Session | None = None) -> str:
     """Query /v1/models to get the served model ID."""
+    http = session or requests
     url = f"{endpoint.rstrip('/')}/v1/models"
-    resp = requests.get(url, timeout=10)
+    resp = http.get(url, timeout=10)
     resp.raise_for_status()
     models = resp.json().get("data", [])
     if not models:
@@ -396,7 +451,8 @@ def resolve_model_name(endpoint: str) -> str:
 
 def call_llm(endpoint: str, model: str,
              system_prompt: str, user_prompt: str,
-             timeout: int = 180, retries: int = 2) -> str:
+             timeout: int = 180, retries: int = 2,
+             session: requests.Session | None = None) -> str:
     """Call OpenAI-compatible chat completions API.
 
     No API key is needed for on-premise vLLM endpoints.
@@ -405,6 +461,7 @@ def call_llm(endpoint: str, model: str,
     """
     import time as _time
 
+    http = session or requests
     url = f"{endpoint.rstrip('/')}/v1/chat/completions"
     payload = {
         "model": model,
@@ -418,7 +475,7 @@ def call_llm(endpoint: str, model: str,
     last_err = None
     for attempt in range(1 + retries):
         try:
-            resp = requests.post(url, json=payload, timeout=timeout)
+            resp = http.post(url, json=payload, timeout=timeout)
             resp.raise_for_status()
             data = resp.json()
             return data["choices"][0]["message"]["content"]
@@ -478,13 +535,18 @@ def _stringify_array(items: list) -> list[str]:
     return result
 
 
+VALID_FIELDS = {
+    "purpose", "preconditions", "postconditions", "invariants",
+    "side_effects", "error_conditions", "state_transitions",
+    "trust_boundary", "thread_safety", "performance",
+}
+VALID_TRUST = {"trusted", "untrusted", "mixed", "n/a"}
+VALID_SEVERITY = {"fatal", "recoverable", "advisory"}
+VALID_EC_KEYS = {"condition", "behavior", "severity"}
+
+
 def validate_contract(contract: dict) -> dict:
     """Validate and normalise contract field types."""
-    VALID_FIELDS = {
-        "purpose", "preconditions", "postconditions", "invariants",
-        "side_effects", "error_conditions", "state_transitions",
-        "trust_boundary", "thread_safety", "performance",
-    }
     cleaned = {k: v for k, v in contract.items() if k in VALID_FIELDS}
 
     # Drop null/None values for optional string fields.
@@ -509,23 +571,20 @@ def validate_contract(contract: dict) -> dict:
     if "trust_boundary" in cleaned:
         tb = cleaned["trust_boundary"]
         if isinstance(tb, dict):
-            valid_trust = {"trusted", "untrusted", "mixed", "n/a"}
             for key in ("input_trust", "output_trust"):
-                if key in tb and tb[key] not in valid_trust:
+                if key in tb and tb[key] not in VALID_TRUST:
                     tb[key] = "mixed"
             # Drop null sanitization.
             if tb.get("sanitization") is None:
                 del tb["sanitization"]
 
     if "error_conditions" in cleaned:
-        valid_severity = {"fatal", "recoverable", "advisory"}
-        valid_ec_keys = {"condition", "behavior", "severity"}
         normalized = []
         for ec in cleaned["error_conditions"]:
             if isinstance(ec, dict):
                 # Strip unknown keys (e.g. exception_class).
-                ec = {k: v for k, v in ec.items() if k in valid_ec_keys}
-                if "severity" in ec and ec["severity"] not in valid_severity:
+                ec = {k: v for k, v in ec.items() if k in VALID_EC_KEYS}
+                if "severity" in ec and ec["severity"] not in VALID_SEVERITY:
                     del ec["severity"]
                 normalized.append(ec)
         cleaned["error_conditions"] = normalized
@@ -552,64 +611,102 @@ def update_element_metadata(element: dict, model_name: str) -> None:
 def extract_group(group: dict, spec: dict,
                   greploom_db: str, cpg_path: str,
                   llm_endpoint: str, llm_model: str,
-                  system_prompt: str) -> tuple[int, int, list[str]]:
+                  system_prompt: str,
+                  session: requests.Session | None = None,
+                  cve_section: str | None = None) -> dict[str, dict]:
     """Extract contracts for one group (single element or class+methods).
 
-    Returns (successes, failures, error_messages).
+    Returns the {element_id: contract} mapping parsed from the LLM response.
+    The spec is only read here, never modified, so groups can be extracted
+    concurrently; apply_contracts() writes the results back.
+
+    *cve_section* is the get_ecosystem_cves() text, which is the same for
+    every group; pass it in to avoid rebuilding it per group.
     """
     elements = spec["elements"]
 
-    # Ecosystem CVE context (same for all elements in the spec).
-    cve_section = get_ecosystem_cves(spec)
+    if cve_section is None:
+        cve_section = get_ecosystem_cves(spec)
 
     if group["type"] == "single":
         eid = group["element_id"]
         elem = elements[eid]
 
         context_results = query_greploom(elem["node_ref"], greploom_db, cpg_path)
-        findings = get_security_findings(spec, elem.get("file", ""))
-        findings_section = format_findings_section(findings)
-        if cve_section:
-            findings_section = (findings_section + "\n\n" + cve_section
-                                if findings_section else cve_section)
+        findings_section = _findings_context(spec, elem.get("file", ""), cve_section)
 
         user_prompt = build_prompt_single(eid, elem, context_results, findings_section)
-        raw = call_llm(llm_endpoint, llm_model, system_prompt, user_prompt)
-        contracts = parse_contract_response(raw, expected_ids=eid)
-
-        if eid in contracts:
-            elem["contract"] = contracts[eid]
-            update_element_metadata(elem, llm_model)
-            return 1, 0, []
-        return 0, 1, [f"{eid}: contract not found in LLM response"]
+        raw = call_llm(llm_endpoint, llm_model, system_prompt, user_prompt,
+                       session=session)
+        return parse_contract_response(raw, expected_ids=eid)
 
     # Class group
     class_id = group["class_id"]
-    all_ids = group["all_ids"]
     class_elem = elements[class_id]
 
     context_results = query_greploom(class_elem["node_ref"], greploom_db, cpg_path)
-    findings = get_security_findings(spec, class_elem.get("file", ""))
-    findings_section = format_findings_section(findings)
-    if cve_section:
-        findings_section = (findings_section + "\n\n" + cve_section
-                            if findings_section else cve_section)
+    findings_section = _findings_context(spec, class_elem.get("file", ""), cve_section)
 
     user_prompt = build_prompt_class(
         class_id, group["member_ids"], elements, context_results, findings_section
     )
-    raw = call_llm(llm_endpoint, llm_model, system_prompt, user_prompt)
-    contracts = parse_contract_response(raw, expected_ids=all_ids)
+    raw = call_llm(llm_endpoint, llm_model, system_prompt, user_prompt,
+                   session=session)
+    return parse_contract_response(raw, expected_ids=group["all_ids"])
+
+
+def _extract_group_in_worker(*args, **kwargs) -> dict[str, dict]:
+    """Run extract_group() with the worker thread's own HTTP session."""
+    return extract_group(*args, session=thread_session(), **kwargs)
+
+
+def finish_group(group: dict, get_contracts, spec: dict,
+                 spec_path: str, model_name: str) -> tuple[int, int, list[str]]:
+    """Apply one group's extraction result, report it, and save progress.
+
+    *get_contracts* is called with no arguments and returns the
+    extract_group() result (or raises its error). Returns
+    (successes, failures, error_messages).
+    """
+    label = group.get("class_id") or group.get("element_id")
+    try:
+        s, f, errs = apply_contracts(group, get_contracts(),
+                                     spec["elements"], model_name)
+        if f == 0:
+            print(f"ok ({s} extracted)", flush=True)
+        else:
+            print(f"partial ({s} ok, {f} failed)", flush=True)
+        if s > 0:
+            save_spec(spec_path, spec)
+        return s, f, errs
+    except Exception as exc:
+        n = len(group.get("all_ids", [group.get("element_id")]))
+        print(f"FAILED: {exc}", flush=True)
+        return 0, n, [f"{label}: {exc}"]
+
+
+def apply_contracts(group: dict, contracts: dict[str, dict],
+                    elements: dict, model_name: str) -> tuple[int, int, list[str]]:
+    """Write extracted contracts for one group into the spec elements.
+
+    Returns (successes, failures, error_messages).
+    """
+    if group["type"] == "single":
+        ids = [group["element_id"]]
+        missing_msg = "contract not found in LLM response"
+    else:
+        ids = group["all_ids"]
+        missing_msg = "missing from class group response"
 
     successes, failures, errors = 0, 0, []
-    for eid in all_ids:
+    for eid in ids:
         if eid in contracts:
             elements[eid]["contract"] = contracts[eid]
-            update_element_metadata(elements[eid], llm_model)
+            update_element_metadata(elements[eid], model_name)
             successes += 1
         else:
             failures += 1
-            errors.append(f"{eid}: missing from class group response")
+            errors.append(f"{eid}: {missing_msg}")
 
     return successes, failures, errors
 
@@ -624,7 +721,7 @@ def main() -> None:
 
     # Resolve model name from endpoint if not specified.
     if args.llm_model == "default":
-        args.llm_model = resolve_model_name(args.llm_endpoint)
+        args.llm_model = resolve_model_name(args.llm_endpoint, thread_session())
         print(f"Resolved model: {args.llm_model}")
 
     if args.scope:
@@ -634,15 +731,13 @@ def main() -> None:
         in_scope = elements
         print(f"Full scope: {len(in_scope)} elements")
 
-    all_groups = group_elements(in_scope, max_group_size=args.max_group_size,
-                                skip_existing=False)
-    groups = group_elements(in_scope, max_group_size=args.max_group_size,
-                            skip_existing=args.skip_existing)
+    all_groups = group_elements(in_scope, max_group_size=args.max_group_size)
+    groups = (drop_existing(all_groups, in_scope) if args.skip_existing
+              else all_groups)
     n_skipped = len(all_groups) - len(groups)
-    n_class = sum(1 for g in groups if g["type"] == "class")
-    n_single = sum(1 for g in groups if g["type"] == "single")
+    type_counts = Counter(g["type"] for g in groups)
     print(f"Grouped into {len(groups)} extraction units "
-          f"({n_class} class groups, {n_single} singles)")
+          f"({type_counts['class']} class groups, {type_counts['single']} singles)")
     if n_skipped:
         print(f"Skipped {n_skipped} groups with existing contracts")
 
@@ -656,31 +751,55 @@ def main() -> None:
         return
 
     total_success, total_fail, all_errors = 0, 0, []
+    cve_section = get_ecosystem_cves(spec)
 
-    for i, group in enumerate(groups, 1):
-        label = group.get("class_id") or group.get("element_id")
-        print(f"[{i}/{len(groups)}] Extracting {label}...", end=" ", flush=True)
-        try:
-            s, f, errs = extract_group(
-                group, spec,
-                args.greploom_db, args.cpg,
-                args.llm_endpoint, args.llm_model,
-                SYSTEM_PROMPT,
+    if args.concurrency <= 1:
+        # Sequential: run on this thread so Ctrl-C aborts the in-flight call.
+        session = thread_session()
+        for i, group in enumerate(groups, 1):
+            label = group.get("class_id") or group.get("element_id")
+            print(f"[{i}/{len(groups)}] Extracting {label}...", end=" ", flush=True)
+            s, f, errs = finish_group(
+                group,
+                partial(extract_group, group, spec,
+                        args.greploom_db, args.cpg,
+                        args.llm_endpoint, args.llm_model,
+                        SYSTEM_PROMPT, session, cve_section),
+                spec, args.spec, args.llm_model,
             )
             total_success += s
             total_fail += f
             all_errors.extend(errs)
-            if f == 0:
-                print(f"ok ({s} extracted)")
-            else:
-                print(f"partial ({s} ok, {f} failed)")
-            if s > 0:
-                save_spec(args.spec, spec)
-        except Exception as exc:
-            n = len(group.get("all_ids", [group.get("element_id")]))
-            total_fail += n
-            all_errors.append(f"{label}: {exc}")
-            print(f"FAILED: {exc}")
+    else:
+        # Groups are independent and I/O-bound (greploom subprocess + LLM HTTP
+        # call), so run them on a thread pool. Results are applied and the
+        # spec is saved from this thread only.
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = {
+                pool.submit(
+                    _extract_group_in_worker, group, spec,
+                    args.greploom_db, args.cpg,
+                    args.llm_endpoint, args.llm_model,
+                    SYSTEM_PROMPT, cve_section=cve_section,
+                ): group
+                for group in groups
+            }
+            # On Ctrl-C (or any error escaping the loop), cancel the groups
+            # still queued; otherwise the pool's exit would run every one of
+            # them before the interrupt propagates. Only in-flight calls finish.
+            try:
+                for i, future in enumerate(as_completed(futures), 1):
+                    group = futures[future]
+                    label = group.get("class_id") or group.get("element_id")
+                    print(f"[{i}/{len(groups)}] {label}:", end=" ", flush=True)
+                    s, f, errs = finish_group(group, future.result,
+                                              spec, args.spec, args.llm_model)
+                    total_success += s
+                    total_fail += f
+                    all_errors.extend(errs)
+            except BaseException:
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
 
     save_spec(args.spec, spec)
 
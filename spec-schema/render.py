@@ -9,10 +9,11 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
-from jinja2 import ChainableUndefined, Environment, FileSystemLoader
+from jinja2 import ChainableUndefined, Environment, FileSystemLoader, Template
 
 TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
 DEFAULT_TEMPLATE = "spec-review.md.j2"
@@ -39,8 +40,8 @@ def validate_spec(spec: dict) -> list[str]:
     return errors
 
 
-def render(spec: dict, template_path: Path | None = None) -> str:
-    """Render a spec dict to Markdown using the Jinja2 template."""
+def load_template(template_path: Path | None = None) -> Template:
+    """Load the review template (or a custom one) in a configured environment."""
     loader_dir = str(template_path.parent) if template_path else str(TEMPLATE_DIR)
     template_name = template_path.name if template_path else DEFAULT_TEMPLATE
 
@@ -50,8 +51,12 @@ def render(spec: dict, template_path: Path | None = None) -> str:
         undefined=ChainableUndefined,  # missing vars become empty, chainable
     )
 
-    template = env.get_template(template_name)
-    return template.render(**spec)
+    return env.get_template(template_name)
+
+
+def render(spec: dict, template_path: Path | None = None) -> str:
+    """Render a spec dict to Markdown using the Jinja2 template."""
+    return load_template(template_path).render(**spec)
 
 
 def main() -> int:
@@ -79,13 +84,22 @@ def main() -> int:
         print(f"warning: {w}", file=sys.stderr)
 
     template_path = Path(args.template) if args.template else None
-    output = render(spec, template_path)
 
     if args.output:
-        Path(args.output).write_text(output)
+        # Stream chunks to a sibling temp file rather than building the whole
+        # review in memory, and only replace the existing review once the
+        # render has succeeded.
+        tmp_path = f"{args.output}.tmp"
+        try:
+            load_template(template_path).stream(**spec).dump(tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, args.output)
         print(f"wrote {args.output}", file=sys.stderr)
     else:
-        print(output)
+        print(render(spec, template_path))
 
     return 0
 